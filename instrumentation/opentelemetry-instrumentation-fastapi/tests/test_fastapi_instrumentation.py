@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import os
 import unittest
 from collections.abc import Mapping
 from timeit import default_timer
@@ -18,7 +20,6 @@ from typing import Tuple
 from unittest.mock import patch
 
 import fastapi
-from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
 
@@ -48,93 +49,218 @@ _expected_metric_names = [
     "http.server.response.size",
     "http.server.request.size",
 ]
+_duration_and_target_attrs = frozenset(
+    {*_duration_attrs, SpanAttributes.HTTP_TARGET}
+)
 _recommended_attrs = {
-    "http.server.active_requests": _active_requests_count_attrs,
-    "http.server.duration": {*_duration_attrs, SpanAttributes.HTTP_TARGET},
-    "http.server.response.size": {
-        *_duration_attrs,
-        SpanAttributes.HTTP_TARGET,
-    },
-    "http.server.request.size": {
-        *_duration_attrs,
-        SpanAttributes.HTTP_TARGET,
-    },
+    "http.server.active_requests": frozenset(_active_requests_count_attrs),
+    "http.server.duration": _duration_and_target_attrs,
+    "http.server.response.size": _duration_and_target_attrs,
+    "http.server.request.size": _duration_and_target_attrs,
 }
 
 
+_excluded_urls_from_env_cache = {}
+
+
+def _get_excluded_urls_from_env():
+    """Memoizes `get_excluded_urls("FASTAPI")` on the variables it reads."""
+    key = (
+        os.environ.get("OTEL_PYTHON_FASTAPI_EXCLUDED_URLS"),
+        os.environ.get("OTEL_PYTHON_EXCLUDED_URLS"),
+    )
+    if key not in _excluded_urls_from_env_cache:
+        _excluded_urls_from_env_cache[key] = get_excluded_urls("FASTAPI")
+    return _excluded_urls_from_env_cache[key]
+
+
+def _get_server_span(spans):
+    server_kind = trace.SpanKind.SERVER
+    return next(span for span in spans if span.kind is server_kind)
+
+
+async def _asgi_get_async(app, path):
+    """Sends a GET request straight to the ASGI app.
+
+    This skips the HTTP client and portal thread used by `TestClient`.
+    Returns the messages the app sent back.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "https",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 443),
+    }
+    request_sent = False
+    messages = []
+
+    async def receive():
+        nonlocal request_sent
+        if request_sent:
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages
+
+
+def _create_fastapi_app():
+    app = fastapi.FastAPI()
+
+    @app.get("/foobar")
+    async def _():
+        return {"message": "hello world"}
+
+    @app.get("/user/{username}")
+    async def _(username: str):
+        return {"message": username}
+
+    @app.get("/exclude/{param}")
+    async def _(param: str):
+        return {"message": param}
+
+    @app.get("/healthzz")
+    async def _():
+        return {"message": "ok"}
+
+    return app
+
+
 class TestFastAPIManualInstrumentation(TestBase):
+    _EXPECTED_DURATION_ATTRS = {
+        "http.method": "GET",
+        "http.host": "testserver:443",
+        "http.scheme": "https",
+        "http.flavor": "1.1",
+        "http.server_name": "testserver",
+        "net.host.port": 443,
+        "http.status_code": 200,
+        "http.target": "/foobar",
+    }
+    _EXPECTED_REQUESTS_ATTRS = {
+        "http.method": "GET",
+        "http.host": "testserver:443",
+        "http.scheme": "https",
+        "http.flavor": "1.1",
+        "http.server_name": "testserver",
+    }
+    server_request_hook = None
+    client_request_hook = None
+    client_response_hook = None
+    # Subclasses whose _create_app builds a fresh app set this to False so
+    # the shared app is not built for them.
+    _uses_shared_app = True
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env_patch = patch.dict(
+            "os.environ",
+            {"OTEL_PYTHON_FASTAPI_EXCLUDED_URLS": "/exclude/123,healthzz"},
+        )
+        cls.env_patch.start()
+        # Class cleanups also run when a later line of setUpClass raises,
+        # so the patches cannot leak into other test classes.
+        cls.addClassCleanup(cls.env_patch.stop)
+        cls.exclude_patch = patch(
+            "opentelemetry.instrumentation.fastapi._excluded_urls_from_env",
+            _get_excluded_urls_from_env(),
+        )
+        cls.exclude_patch.start()
+        cls.addClassCleanup(cls.exclude_patch.stop)
+        cls._instrumentor = otel_fastapi.FastAPIInstrumentor()
+        if cls._uses_shared_app:
+            # Built once per class; each test only instruments the app and
+            # restores its middleware afterwards.
+            cls._shared_app = _create_fastapi_app()
+            cls._shared_app_middleware = list(cls._shared_app.user_middleware)
+        cls._loop = asyncio.new_event_loop()
+        cls.addClassCleanup(cls._loop.close)
+
+    def _asgi_get(self, path):
+        return self._loop.run_until_complete(_asgi_get_async(self._app, path))
+
     def _create_app(self):
-        app = self._create_fastapi_app()
+        app = self._shared_app
         self._instrumentor.instrument_app(
             app=app,
-            server_request_hook=getattr(self, "server_request_hook", None),
-            client_request_hook=getattr(self, "client_request_hook", None),
-            client_response_hook=getattr(self, "client_response_hook", None),
+            server_request_hook=self.server_request_hook,
+            client_request_hook=self.client_request_hook,
+            client_response_hook=self.client_response_hook,
         )
         return app
 
     def _create_app_explicit_excluded_urls(self):
-        app = self._create_fastapi_app()
+        # Re-instrument the shared app; tearDown restores its middleware.
+        app = self._app
+        self._instrumentor.uninstrument_app(app)
+        # uninstrument_app rebuilds the stack; add_middleware refuses once built.
+        app.middleware_stack = None
         to_exclude = "/user/123,/foobar"
         self._instrumentor.instrument_app(
             app,
             excluded_urls=to_exclude,
-            server_request_hook=getattr(self, "server_request_hook", None),
-            client_request_hook=getattr(self, "client_request_hook", None),
-            client_response_hook=getattr(self, "client_response_hook", None),
+            server_request_hook=self.server_request_hook,
+            client_request_hook=self.client_request_hook,
+            client_response_hook=self.client_response_hook,
         )
         return app
 
     def setUp(self):
         super().setUp()
-        self.env_patch = patch.dict(
-            "os.environ",
-            {"OTEL_PYTHON_FASTAPI_EXCLUDED_URLS": "/exclude/123,healthzz"},
-        )
-        self.env_patch.start()
-        self.exclude_patch = patch(
-            "opentelemetry.instrumentation.fastapi._excluded_urls_from_env",
-            get_excluded_urls("FASTAPI"),
-        )
-        self.exclude_patch.start()
-        self._instrumentor = otel_fastapi.FastAPIInstrumentor()
         self._app = self._create_app()
-        self._app.add_middleware(HTTPSRedirectMiddleware)
-        self._client = TestClient(self._app)
 
     def tearDown(self):
         super().tearDown()
-        self.env_patch.stop()
-        self.exclude_patch.stop()
+        # uninstrument() warns when the test never called instrument().
         with self.disable_logging():
             self._instrumentor.uninstrument()
-            self._instrumentor.uninstrument_app(self._app)
+        self._instrumentor.uninstrument_app(self._app)
+        if self._uses_shared_app:
+            self._shared_app.user_middleware = list(
+                self._shared_app_middleware
+            )
+            # Let the next test's instrument_app rebuild the stack.
+            self._shared_app.middleware_stack = None
 
     def test_instrument_app_with_instrument(self):
         if not isinstance(self, TestAutoInstrumentation):
             self._instrumentor.instrument()
-        self._client.get("/foobar")
+        self._asgi_get("/foobar")
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 3)
-        for span in spans:
-            self.assertIn("GET /foobar", span.name)
-            self.assertEqual(
-                span.instrumentation_scope.name,
-                "opentelemetry.instrumentation.fastapi",
-            )
+        self.assertEqual(
+            {span.name for span in spans},
+            {"GET /foobar", "GET /foobar http send"},
+        )
+        self.assertEqual(
+            {span.instrumentation_scope.name for span in spans},
+            {"opentelemetry.instrumentation.fastapi"},
+        )
 
     def test_uninstrument_app(self):
-        self._client.get("/foobar")
+        self._asgi_get("/foobar")
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 3)
 
         self._instrumentor.uninstrument_app(self._app)
-        self.assertFalse(
-            isinstance(
-                self._app.user_middleware[0].cls, OpenTelemetryMiddleware
-            )
+        self.assertNotIn(
+            OpenTelemetryMiddleware,
+            [middleware.cls for middleware in self._app.user_middleware],
         )
-        self._client = TestClient(self._app)
+        self._client = TestClient(self._app, base_url="https://testserver")
         resp = self._client.get("/foobar")
         self.assertEqual(200, resp.status_code)
         span_list = self.memory_exporter.get_finished_spans()
@@ -144,24 +270,28 @@ class TestFastAPIManualInstrumentation(TestBase):
         if not isinstance(self, TestAutoInstrumentation):
             self._instrumentor.instrument()
         self._instrumentor.uninstrument_app(self._app)
-        self._client.get("/foobar")
+        self._asgi_get("/foobar")
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 0)
 
     def test_basic_fastapi_call(self):
-        self._client.get("/foobar")
+        self._asgi_get("/foobar")
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 3)
-        for span in spans:
-            self.assertIn("GET /foobar", span.name)
+        self.assertEqual(
+            {span.name for span in spans},
+            {"GET /foobar", "GET /foobar http send"},
+        )
 
     def test_fastapi_route_attribute_added(self):
         """Ensure that fastapi routes are used as the span name."""
-        self._client.get("/user/123")
+        self._asgi_get("/user/123")
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 3)
-        for span in spans:
-            self.assertIn("GET /user/{username}", span.name)
+        self.assertEqual(
+            {span.name for span in spans},
+            {"GET /user/{username}", "GET /user/{username} http send"},
+        )
         self.assertEqual(
             spans[-1].attributes[SpanAttributes.HTTP_ROUTE], "/user/{username}"
         )
@@ -173,28 +303,30 @@ class TestFastAPIManualInstrumentation(TestBase):
 
     def test_fastapi_excluded_urls(self):
         """Ensure that given fastapi routes are excluded."""
-        self._client.get("/exclude/123")
+        self._asgi_get("/exclude/123")
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 0)
-        self._client.get("/healthzz")
+        self._asgi_get("/healthzz")
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 0)
 
     def test_fastapi_excluded_urls_not_env(self):
         """Ensure that given fastapi routes are excluded when passed explicitly (not in the environment)"""
         app = self._create_app_explicit_excluded_urls()
-        client = TestClient(app)
-        client.get("/user/123")
+        self._loop.run_until_complete(_asgi_get_async(app, "/user/123"))
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 0)
-        client.get("/foobar")
+        self._loop.run_until_complete(_asgi_get_async(app, "/foobar"))
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 0)
 
     def test_fastapi_metrics(self):
-        self._client.get("/foobar")
-        self._client.get("/foobar")
-        self._client.get("/foobar")
+        async def get_concurrently():
+            await asyncio.gather(
+                *(_asgi_get_async(self._app, "/foobar") for _ in range(3))
+            )
+
+        self._loop.run_until_complete(get_concurrently())
         metrics_list = self.memory_metrics_reader.get_metrics_data()
         number_data_point_seen = False
         histogram_data_point_seen = False
@@ -209,7 +341,7 @@ class TestFastAPIManualInstrumentation(TestBase):
                 self.assertTrue(len(scope_metric.metrics) == 3)
                 for metric in scope_metric.metrics:
                     self.assertIn(metric.name, _expected_metric_names)
-                    data_points = list(metric.data.data_points)
+                    data_points = metric.data.data_points
                     self.assertEqual(len(data_points), 1)
                     for point in data_points:
                         if isinstance(point, HistogramDataPoint):
@@ -225,47 +357,33 @@ class TestFastAPIManualInstrumentation(TestBase):
 
     def test_basic_metric_success(self):
         start = default_timer()
-        self._client.get("/foobar")
+        self._asgi_get("/foobar")
         duration = max(round((default_timer() - start) * 1000), 0)
-        expected_duration_attributes = {
-            "http.method": "GET",
-            "http.host": "testserver:443",
-            "http.scheme": "https",
-            "http.flavor": "1.1",
-            "http.server_name": "testserver",
-            "net.host.port": 443,
-            "http.status_code": 200,
-            "http.target": "/foobar",
-        }
-        expected_requests_count_attributes = {
-            "http.method": "GET",
-            "http.host": "testserver:443",
-            "http.scheme": "https",
-            "http.flavor": "1.1",
-            "http.server_name": "testserver",
-        }
         metrics_list = self.memory_metrics_reader.get_metrics_data()
         for metric in (
             metrics_list.resource_metrics[0].scope_metrics[0].metrics
         ):
-            for point in list(metric.data.data_points):
+            for point in metric.data.data_points:
                 if isinstance(point, HistogramDataPoint):
                     self.assertDictEqual(
-                        expected_duration_attributes,
+                        self._EXPECTED_DURATION_ATTRS,
                         dict(point.attributes),
                     )
                     self.assertEqual(point.count, 1)
                     self.assertAlmostEqual(duration, point.sum, delta=40)
                 if isinstance(point, NumberDataPoint):
                     self.assertDictEqual(
-                        expected_requests_count_attributes,
+                        self._EXPECTED_REQUESTS_ATTRS,
                         dict(point.attributes),
                     )
                     self.assertEqual(point.value, 0)
 
     def test_basic_post_request_metric_success(self):
+        # The only test that needs the full HTTP client, for the request
+        # and response content-length headers.
+        client = TestClient(self._app, base_url="https://testserver")
         start = default_timer()
-        response = self._client.post(
+        response = client.post(
             "/foobar",
             json={"foo": "bar"},
         )
@@ -276,7 +394,7 @@ class TestFastAPIManualInstrumentation(TestBase):
         for metric in (
             metrics_list.resource_metrics[0].scope_metrics[0].metrics
         ):
-            for point in list(metric.data.data_points):
+            for point in metric.data.data_points:
                 if isinstance(point, HistogramDataPoint):
                     self.assertEqual(point.count, 1)
                     if metric.name == "http.server.duration":
@@ -289,14 +407,14 @@ class TestFastAPIManualInstrumentation(TestBase):
                     self.assertEqual(point.value, 0)
 
     def test_metric_uninstrument_app(self):
-        self._client.get("/foobar")
+        self._asgi_get("/foobar")
         self._instrumentor.uninstrument_app(self._app)
-        self._client.get("/foobar")
+        self._asgi_get("/foobar")
         metrics_list = self.memory_metrics_reader.get_metrics_data()
         for metric in (
             metrics_list.resource_metrics[0].scope_metrics[0].metrics
         ):
-            for point in list(metric.data.data_points):
+            for point in metric.data.data_points:
                 if isinstance(point, HistogramDataPoint):
                     self.assertEqual(point.count, 1)
                 if isinstance(point, NumberDataPoint):
@@ -305,42 +423,20 @@ class TestFastAPIManualInstrumentation(TestBase):
     def test_metric_uninstrument(self):
         if not isinstance(self, TestAutoInstrumentation):
             self._instrumentor.instrument()
-        self._client.get("/foobar")
+        self._asgi_get("/foobar")
         self._instrumentor.uninstrument()
-        self._client.get("/foobar")
+        self._asgi_get("/foobar")
 
         metrics_list = self.memory_metrics_reader.get_metrics_data()
         for metric in (
             metrics_list.resource_metrics[0].scope_metrics[0].metrics
         ):
-            for point in list(metric.data.data_points):
+            for point in metric.data.data_points:
                 if isinstance(point, HistogramDataPoint):
                     self.assertEqual(point.count, 1)
                 if isinstance(point, NumberDataPoint):
                     self.assertEqual(point.value, 0)
 
-    @staticmethod
-    def _create_fastapi_app():
-        app = fastapi.FastAPI()
-
-        @app.get("/foobar")
-        async def _():
-            return {"message": "hello world"}
-
-        @app.get("/user/{username}")
-        async def _(username: str):
-            return {"message": username}
-
-        @app.get("/exclude/{param}")
-        async def _(param: str):
-            return {"message": param}
-
-        @app.get("/healthzz")
-        async def _():
-            return {"message": "ok"}
-
-        return app
-
 
 class TestFastAPIManualInstrumentationHooks(TestFastAPIManualInstrumentation):
     _server_request_hook = None
@@ -375,21 +471,23 @@ class TestFastAPIManualInstrumentationHooks(TestFastAPIManualInstrumentation):
         self._client_request_hook = client_request_hook
         self._client_response_hook = client_response_hook
 
-        self._client.get("/foobar")
-        spans = self.sorted_spans(self.memory_exporter.get_finished_spans())
+        self._asgi_get("/foobar")
+        spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(
             len(spans), 3
         )  # 1 server span and 2 response spans (response start and body)
 
-        server_span = spans[2]
+        server_span = _get_server_span(spans)
         self.assertEqual(server_span.name, "name from server hook")
 
-        response_spans = spans[:2]
-        for span in response_spans:
-            self.assertEqual(span.name, "name from response hook")
-            self.assertSpanHasAttributes(
-                span, {"attr-from-response-hook": "value"}
-            )
+        response_spans = [span for span in spans if span is not server_span]
+        self.assertEqual(
+            {
+                (span.name, span.attributes.get("attr-from-response-hook"))
+                for span in response_spans
+            },
+            {("name from response hook", "value")},
+        )
 
 
 class TestAutoInstrumentation(TestFastAPIManualInstrumentation):
@@ -399,38 +497,54 @@ class TestAutoInstrumentation(TestFastAPIManualInstrumentation):
     to both.
     """
 
-    def _create_app(self):
-        # instrumentation is handled by the instrument call
+    _uses_shared_app = False
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Tests assert on finished spans as soon as a request returns, so
+        # spans must be exported synchronously. create_tracer_provider wires
+        # a SimpleSpanProcessor; a BatchSpanProcessor would hold spans in its
+        # queue until the schedule delay elapses or it is flushed.
         resource = Resource.create({"key1": "value1", "key2": "value2"})
-        result = self.create_tracer_provider(resource=resource)
-        tracer_provider, exporter = result
-        self.memory_exporter = exporter
+        (
+            cls._resource_tracer_provider,
+            cls._resource_memory_exporter,
+        ) = cls.create_tracer_provider(resource=resource)
 
-        self._instrumentor.instrument(tracer_provider=tracer_provider)
-        return self._create_fastapi_app()
+    def _create_app(self):
+        # instrumentation is handled by the instrument call
+        self.memory_exporter = self._resource_memory_exporter
+        self.memory_exporter.clear()
 
-    def _create_app_explicit_excluded_urls(self):
-        resource = Resource.create({"key1": "value1", "key2": "value2"})
-        tracer_provider, exporter = self.create_tracer_provider(
-            resource=resource
+        self._instrumentor.instrument(
+            tracer_provider=self._resource_tracer_provider
         )
-        self.memory_exporter = exporter
+        return _create_fastapi_app()
 
+    def _create_app_explicit_excluded_urls(self):
         to_exclude = "/user/123,/foobar"
         self._instrumentor.uninstrument()  # Disable previous instrumentation (setUp)
         self._instrumentor.instrument(
-            tracer_provider=tracer_provider,
+            tracer_provider=self._resource_tracer_provider,
             excluded_urls=to_exclude,
         )
-        return self._create_fastapi_app()
+        return _create_fastapi_app()
 
     def test_request(self):
-        self._client.get("/foobar")
+        self._asgi_get("/foobar")
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 3)
-        for span in spans:
-            self.assertEqual(span.resource.attributes["key1"], "value1")
-            self.assertEqual(span.resource.attributes["key2"], "value2")
+        self.assertEqual(
+            {
+                (
+                    span.resource.attributes["key1"],
+                    span.resource.attributes["key2"],
+                )
+                for span in spans
+            },
+            {("value1", "value2")},
+        )
 
     def test_mulitple_way_instrumentation(self):
         self._instrumentor.instrument_app(self._app)
@@ -441,7 +555,7 @@ class TestAutoInstrumentation(TestFastAPIManualInstrumentation):
         self.assertEqual(count, 1)
 
     def test_uninstrument_after_instrument(self):
-        app = self._create_fastapi_app()
+        app = _create_fastapi_app()
         client = TestClient(app)
         client.get("/foobar")
         self._instrumentor.uninstrument()
@@ -462,33 +576,42 @@ class TestAutoInstrumentationHooks(TestFastAPIManualInstrumentationHooks):
     to both.
     """
 
+    _uses_shared_app = False
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Spans are exported synchronously, see TestAutoInstrumentation.
+        resource = Resource.create({"key1": "value1", "key2": "value2"})
+        (
+            cls._resource_tracer_provider,
+            cls._resource_memory_exporter,
+        ) = cls.create_tracer_provider(resource=resource)
+
     def _create_app(self):
         # instrumentation is handled by the instrument call
         self._instrumentor.instrument(
-            server_request_hook=getattr(self, "server_request_hook", None),
-            client_request_hook=getattr(self, "client_request_hook", None),
-            client_response_hook=getattr(self, "client_response_hook", None),
+            server_request_hook=self.server_request_hook,
+            client_request_hook=self.client_request_hook,
+            client_response_hook=self.client_response_hook,
         )
 
-        return self._create_fastapi_app()
+        return _create_fastapi_app()
 
     def _create_app_explicit_excluded_urls(self):
-        resource = Resource.create({"key1": "value1", "key2": "value2"})
-        tracer_provider, exporter = self.create_tracer_provider(
-            resource=resource
-        )
-        self.memory_exporter = exporter
+        self.memory_exporter = self._resource_memory_exporter
+        self.memory_exporter.clear()
 
         to_exclude = "/user/123,/foobar"
         self._instrumentor.uninstrument()  # Disable previous instrumentation (setUp)
         self._instrumentor.instrument(
-            tracer_provider=tracer_provider,
+            tracer_provider=self._resource_tracer_provider,
             excluded_urls=to_exclude,
-            server_request_hook=getattr(self, "server_request_hook", None),
-            client_request_hook=getattr(self, "client_request_hook", None),
-            client_response_hook=getattr(self, "client_response_hook", None),
+            server_request_hook=self.server_request_hook,
+            client_request_hook=self.client_request_hook,
+            client_response_hook=self.client_response_hook,
         )
-        return self._create_fastapi_app()
+        return _create_fastapi_app()
 
     def tearDown(self):
         self._instrumentor.uninstrument()
@@ -517,20 +640,14 @@ class TestWrappedApplication(TestBase):
     def setUp(self):
         super().setUp()
 
-        self.app = fastapi.FastAPI()
-
-        @self.app.get("/foobar")
-        async def _():
-            return {"message": "hello world"}
-
+        self.app = _create_fastapi_app()
         otel_fastapi.FastAPIInstrumentor().instrument_app(self.app)
         self.client = TestClient(self.app)
         self.tracer = self.tracer_provider.get_tracer(__name__)
 
     def tearDown(self) -> None:
         super().tearDown()
-        with self.disable_logging():
-            otel_fastapi.FastAPIInstrumentor().uninstrument_app(self.app)
+        otel_fastapi.FastAPIInstrumentor().uninstrument_app(self.app)
 
     def test_mark_span_internal_in_presence_of_span_from_other_framework(self):
         with self.tracer.start_as_current_span(
@@ -593,8 +710,7 @@ class TestHTTPAppWithCustomHeaders(TestBase):
 
     def tearDown(self) -> None:
         super().tearDown()
-        with self.disable_logging():
-            otel_fastapi.FastAPIInstrumentor().uninstrument_app(self.app)
+        otel_fastapi.FastAPIInstrumentor().uninstrument_app(self.app)
 
     @staticmethod
     def _create_app():
@@ -644,9 +760,7 @@ class TestHTTPAppWithCustomHeaders(TestBase):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 3)
 
-        server_span = [
-            span for span in span_list if span.kind == trace.SpanKind.SERVER
-        ][0]
+        server_span = _get_server_span(span_list)
 
         self.assertSpanHasAttributes(server_span, expected)
 
@@ -670,9 +784,7 @@ class TestHTTPAppWithCustomHeaders(TestBase):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 3)
 
-        server_span = [
-            span for span in span_list if span.kind == trace.SpanKind.SERVER
-        ][0]
+        server_span = _get_server_span(span_list)
 
         for key, _ in not_expected.items():
             self.assertNotIn(key, server_span.attributes)
@@ -700,9 +812,7 @@ class TestHTTPAppWithCustomHeaders(TestBase):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 3)
 
-        server_span = [
-            span for span in span_list if span.kind == trace.SpanKind.SERVER
-        ][0]
+        server_span = _get_server_span(span_list)
         self.assertSpanHasAttributes(server_span, expected)
 
     def test_http_custom_response_headers_not_in_span_attributes(self):
@@ -716,9 +826,7 @@ class TestHTTPAppWithCustomHeaders(TestBase):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 3)
 
-        server_span = [
-            span for span in span_list if span.kind == trace.SpanKind.SERVER
-        ][0]
+        server_span = _get_server_span(span_list)
 
         for key, _ in not_expected.items():
             self.assertNotIn(key, server_span.attributes)
@@ -741,8 +849,7 @@ class TestWebSocketAppWithCustomHeaders(TestBase):
 
     def tearDown(self) -> None:
         super().tearDown()
-        with self.disable_logging():
-            otel_fastapi.FastAPIInstrumentor().uninstrument_app(self.app)
+        otel_fastapi.FastAPIInstrumentor().uninstrument_app(self.app)
 
     @staticmethod
     def _create_app():
@@ -797,9 +904,7 @@ class TestWebSocketAppWithCustomHeaders(TestBase):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 5)
 
-        server_span = [
-            span for span in span_list if span.kind == trace.SpanKind.SERVER
-        ][0]
+        server_span = _get_server_span(span_list)
 
         self.assertSpanHasAttributes(server_span, expected)
 
@@ -830,9 +935,7 @@ class TestWebSocketAppWithCustomHeaders(TestBase):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 5)
 
-        server_span = [
-            span for span in span_list if span.kind == trace.SpanKind.SERVER
-        ][0]
+        server_span = _get_server_span(span_list)
 
         for key, _ in not_expected.items():
             self.assertNotIn(key, server_span.attributes)
@@ -854,9 +957,7 @@ class TestWebSocketAppWithCustomHeaders(TestBase):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 5)
 
-        server_span = [
-            span for span in span_list if span.kind == trace.SpanKind.SERVER
-        ][0]
+        server_span = _get_server_span(span_list)
 
         self.assertSpanHasAttributes(server_span, expected)
 
@@ -874,9 +975,7 @@ class TestWebSocketAppWithCustomHeaders(TestBase):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 5)
 
-        server_span = [
-            span for span in span_list if span.kind == trace.SpanKind.SERVER
-        ][0]
+        server_span = _get_server_span(span_list)
 
         for key, _ in not_expected.items():
             self.assertNotIn(key, server_span.attributes)
@@ -891,11 +990,7 @@ class TestWebSocketAppWithCustomHeaders(TestBase):
 class TestNonRecordingSpanWithCustomHeaders(TestBase):
     def setUp(self):
         super().setUp()
-        self.app = fastapi.FastAPI()
-
-        @self.app.get("/foobar")
-        async def _():
-            return {"message": "hello world"}
+        self.app = _create_fastapi_app()
 
         reset_trace_globals()
         tracer_provider = trace.NoOpTracerProvider()
@@ -907,8 +1002,7 @@ class TestNonRecordingSpanWithCustomHeaders(TestBase):
 
     def tearDown(self) -> None:
         super().tearDown()
-        with self.disable_logging():
-            self._instrumentor.uninstrument_app(self.app)
+        self._instrumentor.uninstrument_app(self.app)
 
     def test_custom_header_not_present_in_non_recording_span(self):
         resp = self.client.get(